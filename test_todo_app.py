@@ -0,0 +1,157 @@
+import pytest
+
+import todo_app
+
+
+@pytest.fixture
+def data_file(tmp_path, monkeypatch):
+    """Point the app at a temp tasks.txt and reset its unsaved-change state."""
+    path = tmp_path / "tasks.txt"
+    monkeypatch.setattr(todo_app, "DATA_FILE", path)
+    monkeypatch.setattr(todo_app, "TEMP_FILE", path.with_suffix(".txt.tmp"))
+    monkeypatch.setattr(todo_app, "_dirty", False)
+    monkeypatch.setattr(todo_app, "_pending_appends", [])
+    return path
+
+
+def test_append_after_file_without_trailing_newline(data_file):
+    data_file.write_bytes(b"HIGH|Buy milk")
+    tasks = todo_app.load_tasks()
+    tasks.append(todo_app.make_task("LOW", "Walk dog"))
+    todo_app.queue_append(tasks[-1])
+    todo_app.flush_if_dirty(tasks)
+
+    assert data_file.read_bytes() == b"HIGH|Buy milk\nLOW|Walk dog\n"
+    assert todo_app.load_tasks() == [
+        todo_app.make_task("HIGH", "Buy milk"),
+        todo_app.make_task("LOW", "Walk dog"),
+    ]
+
+
+def test_append_to_missing_file(data_file):
+    todo_app.append_tasks([todo_app.make_task("MEDIUM", "Call mom")])
+    assert data_file.read_bytes() == b"MEDIUM|Call mom\n"
+
+
+def test_added_task_lands_at_end_of_its_importance_group(monkeypatch):
+    monkeypatch.setattr(todo_app, "_sorted_cache", None)
+    monkeypatch.setattr(todo_app, "_deleted", set())
+    tasks = [todo_app.make_task(imp, str(i))
+             for i, imp in enumerate(["LOW", "HIGH", "MEDIUM", "LOW", "HIGH"])]
+    todo_app.get_sorted_indices(tasks)
+    for imp in ["MEDIUM", "HIGH", "LOW"]:
+        tasks.append(todo_app.make_task(imp, "new"))
+        todo_app.insert_into_sorted_cache(tasks)
+    assert todo_app.get_sorted_indices(tasks) == todo_app.sorted_indices_by_importance(tasks)
+
+
+def test_high_task_inserted_ahead_of_long_low_tail(monkeypatch):
+    monkeypatch.setattr(todo_app, "_sorted_cache", None)
+    monkeypatch.setattr(todo_app, "_deleted", set())
+    tasks = [todo_app.make_task("HIGH", "h0"), todo_app.make_task("MEDIUM", "m0")]
+    tasks += [todo_app.make_task("LOW", f"l{i}") for i in range(200)]
+    todo_app.get_sorted_indices(tasks)
+    for imp in ["HIGH", "MEDIUM", "HIGH"]:
+        tasks.append(todo_app.make_task(imp, "new"))
+        todo_app.insert_into_sorted_cache(tasks)
+    order = todo_app.get_sorted_indices(tasks)
+    assert order == todo_app.sorted_indices_by_importance(tasks)
+    assert order[:5] == [0, 202, 204, 1, 203]
+
+
+def test_save_skips_deleted_tasks_without_compacting(data_file, monkeypatch):
+    monkeypatch.setattr(todo_app, "_sorted_cache", None)
+    monkeypatch.setattr(todo_app, "_deleted", set())
+    tasks = [todo_app.make_task("HIGH", "a"), todo_app.make_task("LOW", "b"),
+             todo_app.make_task("MEDIUM", "c")]
+    removed = todo_app.remove_task(tasks, 0)  # sorted order is a, c, b
+    assert removed.text == "a" and len(tasks) == 3  # tombstoned, not yet compacted
+    todo_app.save_tasks(tasks)
+    assert data_file.read_text(encoding="utf-8") == "LOW|b\nMEDIUM|c\n"
+
+
+def test_failed_rewrite_stays_pending(data_file, monkeypatch):
+    monkeypatch.setattr(todo_app, "_deleted", set())
+    data_file.write_text("HIGH|a\nLOW|b\n", encoding="utf-8")
+    tasks = [todo_app.make_task("HIGH", "a")]  # "b" was deleted
+    todo_app.mark_dirty()
+    monkeypatch.setattr(todo_app, "TEMP_FILE", data_file.parent / "missing" / "tasks.txt.tmp")
+    todo_app.flush_if_dirty(tasks)
+    assert todo_app._dirty
+
+    # A later add must still trigger the full rewrite, not just an append
+    tasks.append(todo_app.make_task("LOW", "c"))
+    todo_app.queue_append(tasks[-1])
+    monkeypatch.setattr(todo_app, "TEMP_FILE", data_file.with_suffix(".txt.tmp"))
+    todo_app.flush_if_dirty(tasks)
+    assert not todo_app._dirty
+    assert data_file.read_text(encoding="utf-8") == "HIGH|a\nLOW|c\n"
+
+
+def test_failed_append_falls_back_to_full_rewrite(data_file, monkeypatch):
+    monkeypatch.setattr(todo_app, "_deleted", set())
+    tasks = [todo_app.make_task("HIGH", "a")]
+    todo_app.queue_append(tasks[-1])
+    todo_app.flush_if_dirty(tasks)
+
+    real_append = todo_app.append_tasks
+    def failing_append(new_tasks):
+        monkeypatch.setattr(todo_app, "DATA_FILE", data_file.parent / "missing" / "tasks.txt")
+        try:
+            return real_append(new_tasks)
+        finally:
+            monkeypatch.setattr(todo_app, "DATA_FILE", data_file)
+    monkeypatch.setattr(todo_app, "append_tasks", failing_append)
+    tasks.append(todo_app.make_task("LOW", "b"))
+    todo_app.queue_append(tasks[-1])
+    todo_app.flush_if_dirty(tasks)
+    assert todo_app._dirty
+
+    monkeypatch.setattr(todo_app, "append_tasks", real_append)
+    tasks.append(todo_app.make_task("LOW", "c"))
+    todo_app.queue_append(tasks[-1])
+    todo_app.flush_if_dirty(tasks)
+    assert data_file.read_text(encoding="utf-8") == "HIGH|a\nLOW|b\nLOW|c\n"
+
+
+@pytest.mark.parametrize("content", [
+    b"HIGH|a\nLOW|b\n",
+    b"HIGH|a\r\nLOW|b\r\n",
+    b"HIGH|a\rLOW|b\r",
+])
+def test_load_handles_any_line_ending(data_file, content):
+    data_file.write_bytes(content)
+    assert todo_app.load_tasks() == [
+        todo_app.make_task("HIGH", "a"),
+        todo_app.make_task("LOW", "b"),
+    ]
+
+
+def test_load_normalizes_case_and_padding(data_file):
+    data_file.write_text(
+        " high |padded\nMedium|mixed\n\tlow\t|tabs\nHIGH\x0b|vt\n\x0cHIGH|ff\nHIGH\xa0|nbsp\n",
+        encoding="utf-8",
+    )
+    assert todo_app.load_tasks() == [
+        todo_app.make_task("HIGH", "padded"),
+        todo_app.make_task("MEDIUM", "mixed"),
+        todo_app.make_task("LOW", "tabs"),
+        todo_app.make_task("HIGH", "vt"),
+        todo_app.make_task("HIGH", "ff"),
+        todo_app.make_task("HIGH", "nbsp"),
+    ]
+
+
+def test_load_skips_blank_and_malformed_lines(data_file):
+    data_file.write_text(
+        "\n"
+        "HIGH|  \n"          # blank text
+        "no separator\n"
+        "URGENT|bad level\n"
+        "HIGHER|not a level\n"
+        "|missing level\n"
+        "HIGH\n|split across lines\n"
+        "LOW|keep|pipes\n",
+        encoding="utf-8",
+    )
+    assert todo_app.load_tasks() == [todo_app.make_task("LOW", "keep|pipes")]
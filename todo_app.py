@@ -1,90 +1,279 @@
 
-from typing import List, Dict, Tuple, Optional
+import atexit
+import os
+import re
+import sys
+from itertools import chain
+from typing import Iterable, List, NamedTuple, Set, Tuple, Optional
 from colorama import init as colorama_init, Fore, Style
 from pathlib import Path
 
-# Initialize color support for Windows terminals (PowerShell, cmd) and others
-colorama_init(autoreset=True)
+class _NoColor:
+    """Stand-in for colorama's Fore/Style whose color codes are all empty strings."""
+    def __getattr__(self, name: str) -> str:
+        return ""
+
+if sys.stdout.isatty():
+    # Initialize color support for Windows terminals (PowerShell, cmd) and others
+    colorama_init(autoreset=True)
+else:
+    # Output is piped/redirected: emit plain text and leave stdout unwrapped
+    Fore = Style = _NoColor()
 
 DATA_FILE = Path("tasks.txt")
-IMPORTANCE_ORDER = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
+TEMP_FILE = DATA_FILE.with_suffix(".txt.tmp")
+IMPORTANCE_LEVELS = ("HIGH", "MEDIUM", "LOW")  # indexed by rank
+IMPORTANCE_ORDER = {level: rank for rank, level in enumerate(IMPORTANCE_LEVELS)}
+PAGE_SIZE = 20  # Task rows shown per page in the list views
+
+class Task(NamedTuple):
+    """A single to-do item: its importance rank (0=HIGH, 1=MEDIUM, 2=LOW) and text."""
+    rank: int
+    text: str
+
+    @property
+    def importance(self) -> str:
+        """The importance level name (HIGH/MEDIUM/LOW) for this task's rank."""
+        return IMPORTANCE_LEVELS[self.rank]
+
+def make_task(importance: str, text: str) -> Task:
+    """Create a Task from an importance level name, storing only its rank."""
+    return Task(IMPORTANCE_ORDER[importance], text)
+
+# Unsaved changes, flushed when an edit returns to the menu (and on exit as a fallback).
+# New tasks are appended to the file; a delete sets _dirty, which requires a full rewrite.
+_dirty = False
+_pending_appends: List[Task] = []
+
+# Sorted display order for the current list; None means it must be rebuilt
+_sorted_cache: Optional[List[int]] = None
+
+# Indices of deleted tasks still sitting in the list; compacted once they pile up
+_deleted: Set[int] = set()
+
+# Position (in sorted order) of the first row on the page currently shown
+_view_offset = 0
 
 # ---- Persistence ----
-def load_tasks() -> List[Dict[str, str]]:
+# Matches one "importance|task text" line: importance case-insensitive, padded by any
+# whitespace except a newline (the same characters str.strip() removed per line)
+_LINE_RE = re.compile(
+    rf"^[^\S\n]*({'|'.join(IMPORTANCE_LEVELS)})[^\S\n]*\|(.*)$", re.IGNORECASE | re.MULTILINE
+)
+
+def load_tasks() -> List[Task]:
     """Load tasks from the text file into a list. Each line is 'importance|task'."""
-    tasks: List[Dict[str, str]] = []
+    tasks: List[Task] = []
     if not DATA_FILE.exists():
         return tasks
     try:
-        with DATA_FILE.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.rstrip("\n")
-                if not line:
-                    continue
-                # Expect "importance|task text"
-                parts = line.split("|", 1)
-                if len(parts) != 2:
-                    continue
-                importance, text = parts
-                importance = importance.strip().upper()
-                text = text.strip()
-                if importance not in {"HIGH", "MEDIUM", "LOW"} or not text:
-                    continue
-                tasks.append({"text": text, "importance": importance})
+        # read_text decodes in one call and turns \r\n / \r line endings into \n;
+        # then one regex pass in C picks out every well-formed line, skipping anything else
+        for raw_importance, raw_text in _LINE_RE.findall(DATA_FILE.read_text(encoding="utf-8")):
+            rank = IMPORTANCE_ORDER.get(raw_importance)
+            if rank is None:
+                # Tolerate hand-edited lines like "high|..."
+                rank = IMPORTANCE_ORDER[raw_importance.upper()]
+            text = raw_text.strip()
+            if not text:
+                continue
+            tasks.append(Task(rank, text))
     except Exception as e:
         print(f"{Fore.RED}✖ Failed to load tasks: {e}")
     return tasks
 
-def save_tasks(tasks: List[Dict[str, str]]) -> None:
-    """Persist tasks to the text file, one per line as 'importance|task'."""
+def serialize_tasks(tasks: Iterable[Task]) -> str:
+    """Build the file contents for tasks in one string, one 'importance|task' per line."""
+    return "".join(f"{t.importance}|{t.text}\n" for t in tasks)
+
+def save_tasks(tasks: List[Task]) -> bool:
+    """Persist tasks to the text file, one per line as 'importance|task', skipping deleted ones.
+    Writes to a temp file and swaps it in, so a crash never leaves a half-written list.
+    Returns True on success."""
     try:
-        with DATA_FILE.open("w", encoding="utf-8") as f:
-            for t in tasks:
-                f.write(f"{t['importance']}|{t['text']}\n")
+        live = (t for i, t in enumerate(tasks) if i not in _deleted)
+        # One write call for the whole file instead of one per task
+        with TEMP_FILE.open("w", encoding="utf-8") as f:
+            f.write(serialize_tasks(live))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(TEMP_FILE, DATA_FILE)
     except Exception as e:
         print(f"{Fore.RED}✖ Failed to save tasks: {e}")
+        try:
+            TEMP_FILE.unlink()
+        except OSError:
+            pass
+        return False
+    return True
+
+def append_tasks(new_tasks: List[Task]) -> bool:
+    """Append tasks to the end of the text file without rewriting existing lines.
+    Returns True on success."""
+    try:
+        data = serialize_tasks(new_tasks).encode("utf-8")
+        with DATA_FILE.open("a+b") as f:
+            # A hand-edited file may lack a trailing newline; don't glue onto its last line
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    data = b"\n" + data
+            f.write(data)
+    except Exception as e:
+        print(f"{Fore.RED}✖ Failed to save tasks: {e}")
+        return False
+    return True
+
+def mark_dirty() -> None:
+    """Record that the file needs a full rewrite (e.g. after a delete)."""
+    global _dirty
+    _dirty = True
+    _pending_appends.clear()
+
+def queue_append(task: Task) -> None:
+    """Queue a newly added task to be appended on the next flush."""
+    if not _dirty:
+        _pending_appends.append(task)
+
+def flush_if_dirty(tasks: List[Task]) -> None:
+    """Write unsaved changes: a full rewrite if needed, otherwise just the new lines.
+    Failed writes stay pending (a failed append becomes a full rewrite), so the next flush retries."""
+    global _dirty
+    if _dirty:
+        if save_tasks(tasks):
+            _dirty = False
+    elif _pending_appends:
+        if append_tasks(_pending_appends):
+            _pending_appends.clear()
+        else:
+            # The append may have been partly written; only a full rewrite is safe now
+            mark_dirty()
 
 # ---- UI Helpers ----
-def color_for_importance(importance: str) -> Tuple[str, str]:
-    """Return (color_code, label) for the given importance level."""
-    imp = importance.upper()
-    if imp == "HIGH":
-        return Fore.RED, "HIGH"
-    if imp == "MEDIUM":
-        return Fore.YELLOW, "MEDIUM"
-    return Fore.GREEN, "LOW"
-
-def sorted_indices_by_importance(tasks: List[Dict[str, str]]) -> List[int]:
+# Precomputed (color_code, label) per importance, indexed by rank
+_COLOR_TABLE = tuple(zip((Fore.RED, Fore.YELLOW, Fore.GREEN), IMPORTANCE_LEVELS))
+
+def sorted_indices_by_importance(tasks: List[Task]) -> List[int]:
     """Return a list of indices representing tasks sorted High → Medium → Low (stable)."""
-    return sorted(
-        range(len(tasks)),
-        key=lambda i: (IMPORTANCE_ORDER.get(tasks[i]["importance"], 3), i)
-    )
+    # Only three levels, so partition into buckets in one pass instead of sorting
+    # (rank doubles as the bucket index: HIGH=0, MEDIUM=1, LOW=2)
+    buckets: Tuple[List[int], List[int], List[int]] = ([], [], [])
+    for i, t in enumerate(tasks):
+        if i not in _deleted:
+            buckets[t.rank].append(i)
+    # Chain the buckets straight into the result (no intermediate concatenated list)
+    return list(chain.from_iterable(buckets))
+
+def get_sorted_indices(tasks: List[Task]) -> List[int]:
+    """Return the sorted display order, reusing the cached one while the list is unchanged."""
+    global _sorted_cache
+    if _sorted_cache is None:
+        _sorted_cache = sorted_indices_by_importance(tasks)
+    return _sorted_cache
+
+def insert_into_sorted_cache(tasks: List[Task]) -> None:
+    """Place the task just appended to tasks into the cached order without re-sorting."""
+    if _sorted_cache is None:
+        return
+    # The order is sorted by (rank, index) and the new task has the highest index, so it
+    # goes right after the last entry of equal or higher importance: binary-search for that
+    new_index = len(tasks) - 1
+    rank = tasks[new_index].rank
+    lo, hi = 0, len(_sorted_cache)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if tasks[_sorted_cache[mid]].rank <= rank:
+            lo = mid + 1
+        else:
+            hi = mid
+    _sorted_cache.insert(lo, new_index)
+
+def task_count(tasks: List[Task]) -> int:
+    """Return how many tasks are in the list, not counting deleted ones."""
+    return len(tasks) - len(_deleted)
+
+def remove_task(tasks: List[Task], sorted_pos: int) -> Task:
+    """Delete the task at sorted_pos in the display order and return it.
+    The task is only tombstoned, so no index in tasks moves and the cached order needs no
+    renumbering; the list is compacted lazily once half of it is deleted."""
+    # Display numbers must stay contiguous, so this pop still shifts the cached order
+    real_index = get_sorted_indices(tasks).pop(sorted_pos)
+    _deleted.add(real_index)
+    removed = tasks[real_index]
+    if len(_deleted) > len(tasks) // 2:
+        compact_tasks(tasks)
+    return removed
+
+def compact_tasks(tasks: List[Task]) -> None:
+    """Physically drop tombstoned tasks from the list (in place) and reset the display order."""
+    global _sorted_cache
+    if not _deleted:
+        return
+    tasks[:] = [t for i, t in enumerate(tasks) if i not in _deleted]
+    _deleted.clear()
+    _sorted_cache = None
+
+# Precomputed '{n}. [LABEL] {text}' row template per importance (indexed by rank), colors baked in
+_ROW_TPL = tuple(
+    f"  {Fore.WHITE}{{n}}. {color}[{label}]{Fore.WHITE} {{text}}"
+    for color, label in _COLOR_TABLE
+)
+
+def print_task_rows(tasks: List[Task], indices: List[int], start: int = 0) -> None:
+    """Print one page of numbered task rows, beginning at position start, with a single write.
+    Row numbers match the full sorted list, so they stay valid whichever page is shown."""
+    end = min(start + PAGE_SIZE, len(indices))
+    lines = []
+    for disp_idx in range(start, end):
+        t = tasks[indices[disp_idx]]
+        lines.append(_ROW_TPL[t.rank].format(n=disp_idx + 1, text=t.text))
+    if start > 0 or end < len(indices):
+        more = " — choose [N] for the next page" if end < len(indices) else ""
+        lines.append(f"  {Fore.BLUE}(showing {start + 1}–{end} of {len(indices)}{more})")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+def has_next_page(tasks: List[Task]) -> bool:
+    """Return True if there are task rows after the page currently shown."""
+    return _view_offset + PAGE_SIZE < task_count(tasks)
 
 def print_welcome() -> None:
     """Print the welcome banner."""
     print(f"{Style.BRIGHT}{Fore.CYAN}Welcome to the To-Do CLI!")
     print(f"{Fore.BLUE}Manage your tasks right from the terminal.\n")
 
-def print_menu() -> None:
-    """Display the main menu options."""
-    print(f"\n{Style.BRIGHT}{Fore.MAGENTA}Main Menu")
-    print(f"{Fore.WHITE}[1]{Fore.GREEN} Add a task")
-    print(f"{Fore.WHITE}[2]{Fore.YELLOW} View tasks (High → Medium → Low)")
-    print(f"{Fore.WHITE}[3]{Fore.RED} Delete a task")
-    print(f"{Fore.WHITE}[4]{Fore.CYAN} Quit")
+# Menu and prompt strings are built once; each line resets styles like a separate print() would
+_MENU_STR = f"{Style.RESET_ALL}\n".join([
+    f"\n{Style.BRIGHT}{Fore.MAGENTA}Main Menu",
+    f"{Fore.WHITE}[1]{Fore.GREEN} Add a task",
+    f"{Fore.WHITE}[2]{Fore.YELLOW} View tasks (High → Medium → Low)",
+    f"{Fore.WHITE}[3]{Fore.RED} Delete a task",
+    f"{Fore.WHITE}[4]{Fore.CYAN} Quit",
+])
+_MENU_NEXT_PAGE_STR = f"{_MENU_STR}{Style.RESET_ALL}\n{Fore.WHITE}[N]{Fore.BLUE} Next page of tasks"
+_CHOICE_PROMPT = f"\n{Fore.WHITE}Enter a choice (1-4): "
+_CHOICE_NEXT_PAGE_PROMPT = f"\n{Fore.WHITE}Enter a choice (1-4 or N): "
+_IMPORTANCE_MENU = f"{Fore.WHITE}Select importance: {Fore.GREEN}[L]ow{Fore.WHITE} / {Fore.YELLOW}[M]edium{Fore.WHITE} / {Fore.RED}[H]igh {Fore.WHITE}/ [C]ancel"
+_IMPORTANCE_PROMPT = f"{Fore.WHITE}Enter H, M, L, or C to cancel: "
+_ADD_PROMPT = f"{Fore.GREEN}Enter a new task (or C to cancel): "
+_DELETE_PROMPT = f"\n{Fore.RED}Enter the displayed task number to delete ({Fore.WHITE}or C to cancel{Fore.RED}): "
+_DELETE_NEXT_PAGE_PROMPT = f"\n{Fore.RED}Enter the displayed task number to delete ({Fore.WHITE}N for next page, or C to cancel{Fore.RED}): "
+
+def print_menu(show_next_page: bool = False) -> None:
+    """Display the main menu options (plus 'Next page' when the task list continues)."""
+    print(_MENU_NEXT_PAGE_STR if show_next_page else _MENU_STR)
 
-def get_choice() -> str:
-    """Prompt the user for a menu selection."""
-    return input(f"\n{Fore.WHITE}Enter a choice (1-4): ").strip()
+def get_choice(show_next_page: bool = False) -> str:
+    """Prompt the user for a menu selection (mentioning N when a next page exists)."""
+    return input(_CHOICE_NEXT_PAGE_PROMPT if show_next_page else _CHOICE_PROMPT).strip()
 
 # ---- Core Features ----
 def prompt_importance() -> Optional[str]:
     """Prompt for importance with retry and cancel support.
     Returns HIGH/MEDIUM/LOW, or None if the user cancels."""
     while True:
-        print(f"{Fore.WHITE}Select importance: {Fore.GREEN}[L]ow{Fore.WHITE} / {Fore.YELLOW}[M]edium{Fore.WHITE} / {Fore.RED}[H]igh {Fore.WHITE}/ [C]ancel")
-        raw = input(f"{Fore.WHITE}Enter H, M, L, or C to cancel: ").strip().lower()
+        print(_IMPORTANCE_MENU)
+        raw = input(_IMPORTANCE_PROMPT).strip().lower()
         if raw in {"c", "cancel"}:
             print(f"{Fore.BLUE}Canceled. Returning to the main menu.")
             return None
@@ -96,11 +285,11 @@ def prompt_importance() -> Optional[str]:
             return "LOW"
         print(f"{Fore.RED}✖ Invalid choice. Please enter H, M, L, or C.")
 
-def add_task(tasks: List[Dict[str, str]]) -> None:
-    """Add a new task with importance to the list and save to file (supports cancel and retries)."""
+def add_task(tasks: List[Task]) -> None:
+    """Add a new task with importance to the list (supports cancel and retries)."""
     # Task text loop with cancel
     while True:
-        text = input(f"{Fore.GREEN}Enter a new task (or C to cancel): ").strip()
+        text = input(_ADD_PROMPT).strip()
         if text.lower() in {"c", "cancel"}:
             print(f"{Fore.BLUE}Canceled. Returning to the main menu.")
             return
@@ -111,42 +300,59 @@ def add_task(tasks: List[Dict[str, str]]) -> None:
     importance = prompt_importance()
     if importance is None:
         return
-    tasks.append({"text": text, "importance": importance})
-    save_tasks(tasks)
-    color, label = color_for_importance(importance)
+    tasks.append(make_task(importance, text))
+    insert_into_sorted_cache(tasks)
+    queue_append(tasks[-1])
+    color, label = _COLOR_TABLE[tasks[-1].rank]
     print(f"{color}✔ Added ({label}): {Fore.WHITE}{text}")
 
-def view_tasks(tasks: List[Dict[str, str]]) -> None:
-    """View all tasks sorted by importance, or show a friendly message if none exist."""
-    if not tasks:
+def view_tasks(tasks: List[Task]) -> None:
+    """View the first page of tasks sorted by importance, or a friendly message if none exist."""
+    global _view_offset
+    if not task_count(tasks):
         print(f"{Fore.BLUE}Your list is empty — add your first task from the menu!")
         return
+    _view_offset = 0
     print(f"\n{Style.BRIGHT}{Fore.YELLOW}Your Tasks (High → Medium → Low):")
-    for disp_idx, i in enumerate(sorted_indices_by_importance(tasks), start=1):
-        t = tasks[i]
-        color, label = color_for_importance(t["importance"])
-        print(f"  {Fore.WHITE}{disp_idx}. {color}[{label}]{Fore.WHITE} {t['text']}")
+    print_task_rows(tasks, get_sorted_indices(tasks), _view_offset)
 
-def delete_task(tasks: List[Dict[str, str]]) -> None:
+def view_next_page(tasks: List[Task]) -> None:
+    """Advance the task view by one page, if there is one."""
+    global _view_offset
+    if not has_next_page(tasks):
+        print(f"{Fore.BLUE}No more tasks — choose [2] to view from the top.")
+        return
+    _view_offset += PAGE_SIZE
+    print(f"\n{Style.BRIGHT}{Fore.YELLOW}Your Tasks (High → Medium → Low):")
+    print_task_rows(tasks, get_sorted_indices(tasks), _view_offset)
+
+def delete_task(tasks: List[Task]) -> None:
     """Delete a task by its displayed number (sorted view) with retries and cancel option."""
-    if not tasks:
+    global _view_offset
+    if not task_count(tasks):
         print(f"{Fore.RED}✖ No tasks to delete.")
         return
 
-    # Build the sorted display and show it
-    sorted_idxs = sorted_indices_by_importance(tasks)
+    # Show the page the user is on; any displayed number from any page is accepted
+    sorted_idxs = get_sorted_indices(tasks)
+    if _view_offset >= len(sorted_idxs):
+        _view_offset = 0
     print(f"\n{Style.BRIGHT}{Fore.YELLOW}Your Tasks (High → Medium → Low):")
-    for disp_idx, i in enumerate(sorted_idxs, start=1):
-        t = tasks[i]
-        color, label = color_for_importance(t["importance"])
-        print(f"  {Fore.WHITE}{disp_idx}. {color}[{label}]{Fore.WHITE} {t['text']}")
+    print_task_rows(tasks, sorted_idxs, _view_offset)
 
     # Input loop: retry on invalid, allow cancel
     while True:
-        raw = input(f"\n{Fore.RED}Enter the displayed task number to delete ({Fore.WHITE}or C to cancel{Fore.RED}): ").strip()
+        raw = input(_DELETE_NEXT_PAGE_PROMPT if has_next_page(tasks) else _DELETE_PROMPT).strip()
         if raw.lower() in {"c", "cancel"}:
             print(f"{Fore.BLUE}Canceled. Returning to the main menu.")
             return
+        if raw.lower() == "n":
+            # Page forward without leaving the delete prompt
+            if has_next_page(tasks):
+                view_next_page(tasks)
+            else:
+                print(f"{Fore.RED}✖ This is the last page. Enter a task number, or C to cancel.")
+            continue
         try:
             disp_index = int(raw)
             if disp_index < 1 or disp_index > len(sorted_idxs):
@@ -156,43 +362,49 @@ def delete_task(tasks: List[Dict[str, str]]) -> None:
             print(f"{Fore.RED}✖ Please enter a valid number, or C to cancel.")
             continue
         # Valid selection
-        real_index = sorted_idxs[disp_index - 1]
-        removed = tasks.pop(real_index)
-        save_tasks(tasks)
-        color, label = color_for_importance(removed["importance"])
-        print(f"{color}🗑 Deleted ({label}): {Fore.WHITE}{removed['text']}")
+        removed = remove_task(tasks, disp_index - 1)
+        mark_dirty()
+        color, label = _COLOR_TABLE[removed.rank]
+        print(f"{color}🗑 Deleted ({label}): {Fore.WHITE}{removed.text}")
         break
 
-    # Always show remaining tasks (sorted)
-    if tasks:
-        print(f"\n{Fore.CYAN}Remaining tasks (High → Medium → Low):")
-        for disp_idx, i in enumerate(sorted_indices_by_importance(tasks), start=1):
-            t = tasks[i]
-            c, l = color_for_importance(t["importance"])
-            print(f"  {Fore.WHITE}{disp_idx}. {c}[{l}]{Fore.CYAN} {t['text']}")
+    # Only report what changed; the full list is one [2] away
+    remaining = task_count(tasks)
+    if remaining:
+        print(f"{Fore.CYAN}{remaining} task(s) remaining — choose [2] to view them.")
     else:
         print(f"{Fore.BLUE}Your list is now empty.")
 
 def main() -> None:
     """Run the interactive To-Do CLI application with persistence."""
-    tasks: List[Dict[str, str]] = load_tasks()
+    tasks: List[Task] = load_tasks()
+    # Last-chance save if we exit mid-edit (e.g. Ctrl+C at a prompt)
+    atexit.register(flush_if_dirty, tasks)
     print_welcome()
     # Show tasks immediately on startup (or a friendly message if none)
     view_tasks(tasks)
 
     while True:
-        print_menu()
-        choice = get_choice()
+        show_next_page = has_next_page(tasks)
+        print_menu(show_next_page)
+        choice = get_choice(show_next_page)
 
         if choice == "1":
             add_task(tasks)
+            flush_if_dirty(tasks)
         elif choice == "2":
             view_tasks(tasks)
         elif choice == "3":
             delete_task(tasks)
+            flush_if_dirty(tasks)
+        elif choice.lower() == "n":
+            view_next_page(tasks)
         elif choice == "4":
+            flush_if_dirty(tasks)
             print(f"\n{Fore.CYAN}Goodbye! 👋")
             break
+        elif show_next_page:
+            print(f"{Fore.RED}✖ Invalid choice. Please select 1, 2, 3, 4, or N.")
         else:
             print(f"{Fore.RED}✖ Invalid choice. Please select 1, 2, 3, or 4.")
 